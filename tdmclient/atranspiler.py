@@ -492,6 +492,9 @@ class ATranspiler:
         self.has_exit_event = False
         self.events_in = {}  # @onevent
         self.events_out = {}  # emit
+        # filled by modules imported during transpilation
+        self.onevent_preamble = {}
+        self.additional_var_declarations = {}
 
     @staticmethod
     def decode_attr(node):
@@ -167,7 +167,10 @@ class Client(ThymioFB):
         self.send_packet(self.create_msg_request_list_of_nodes())
 
     def process_waiting_messages(self):
-        at_least_one = False
+        """Process all the messages received from the tdm and return their
+        number (0 if none, which is falsy).
+        """
+        count = 0
         if self.tdm:
             while True:
                 msg = self.tdm.receive_packet()
@@ -179,5 +182,5 @@ class Client(ThymioFB):
                     msg = self.intercept_incoming_message(msg)
                 if msg:
                     self.process_message(msg)
-                at_least_one = True
-        return at_least_one
+                count += 1
+        return count
@@ -14,18 +14,19 @@ class NodeLockError(Exception):
     """Attempt to lock a node which is not available.
     """
 
+    STATUS_STR = {
+        tdmclient.ThymioFB.NODE_STATUS_UNKNOWN: "unknown",
+        tdmclient.ThymioFB.NODE_STATUS_CONNECTED: "connected",
+        tdmclient.ThymioFB.NODE_STATUS_AVAILABLE: "available",
+        tdmclient.ThymioFB.NODE_STATUS_BUSY: "busy",
+        tdmclient.ThymioFB.NODE_STATUS_READY: "ready",
+        tdmclient.ThymioFB.NODE_STATUS_DISCONNECTED: "disconnected",
+    }
+
     def __init__(self, node_status):
         super().__init__()
-        status_str = {
-            tdmclient.ThymioFB.NODE_STATUS_UNKNOWN: "unknown",
-            tdmclient.ThymioFB.NODE_STATUS_CONNECTED: "connected",
-            tdmclient.ThymioFB.NODE_STATUS_AVAILABLE: "available",
-            tdmclient.ThymioFB.NODE_STATUS_BUSY: "busy",
-            tdmclient.ThymioFB.NODE_STATUS_READY: "ready",
-            tdmclient.ThymioFB.NODE_STATUS_DISCONNECTED: "disconnected",
-        }
         try:
-            self.message = f"Node lock error (current status: {status_str[node_status]})"
+            self.message = f"Node lock error (current status: {self.STATUS_STR[node_status]})"
         except:
             self.message = "Node lock error"
         self.node_status = node_status
@@ -38,6 +39,10 @@ class ClientAsync(tdmclient.Client):
 
     DEFAULT_SLEEP = 0.1
 
+    # successive timeouts when waiting for messages which don't come,
+    # capped by DEFAULT_SLEEP
+    BACKOFF_SLEEP = (0.001, 0.003, 0.01, 0.02, 0.05, 0.1)
+
     def __init__(self, node_class=None, **kwargs):
         super(ClientAsync, self).__init__(**kwargs)
         self.node_class = node_class or tdmclient.ClientAsyncCacheNode
@@ -59,17 +64,41 @@ class ClientAsync(tdmclient.Client):
         for node in self.filter_nodes(self.nodes, **kwargs):
             return node
 
+    def wait_for_messages(self, timeout):
+        """Block until a message has been received from the tdm or timeout
+        has elapsed. Return True if a message is ready to be processed.
+        """
+        tdm = self.tdm
+        if tdm is not None and hasattr(tdm, "wait_packet"):
+            return tdm.wait_packet(timeout)
+        # transport which can only be polled
+        sleep(timeout)
+        return False
+
+    def wait_for_messages_backoff(self, backoff_step):
+        """Wait for messages with a timeout which increases with backoff_step,
+        which should be 0 after messages have been processed. Return the
+        next backoff_step.
+        """
+        timeout = min(self.BACKOFF_SLEEP[min(backoff_step, len(self.BACKOFF_SLEEP) - 1)],
+                      self.DEFAULT_SLEEP)
+        return 0 if self.wait_for_messages(timeout) else backoff_step + 1
+
     @types.coroutine
     def sleep(self, duration=-1, wake=None):
-        t0 = monotonic()
-        while duration < 0 or monotonic() < t0 + duration:
-            self.process_waiting_messages()
-            sleep(self.DEFAULT_SLEEP
-                  if duration < 0
-                  else max(min(self.DEFAULT_SLEEP, t0 + duration - monotonic()),
-                           self.DEFAULT_SLEEP / 1e3))
+        process_waiting_messages = self.process_waiting_messages
+        wait_for_messages = self.wait_for_messages
+        default_sleep = self.DEFAULT_SLEEP
+        min_sleep = default_sleep / 1e3
+        deadline = monotonic() + duration
+        while duration < 0 or monotonic() < deadline:
+            process_waiting_messages()
             if wake is not None and wake():
                 break
+            wait_for_messages(default_sleep
+                              if duration < 0
+                              else max(min(default_sleep, deadline - monotonic()),
+                                       min_sleep))
             yield
 
     @types.coroutine
@@ -94,41 +123,56 @@ class ClientAsync(tdmclient.Client):
 
     @types.coroutine
     def wait_for_node(self, timeout=None, **kwargs):
-        time = 0
-        while timeout is None or time < timeout:
-            if self.process_waiting_messages():
-                node = self.first_node(**kwargs)
-                if node is not None:
-                    return node
-            else:
-                sleep(self.DEFAULT_SLEEP)
-                time += self.DEFAULT_SLEEP
+        t0 = monotonic()
+        process_waiting_messages = self.process_waiting_messages
+        first_node = self.first_node
+        wait_for_messages_backoff = self.wait_for_messages_backoff
+        backoff_step = 0
+        while True:
+            if process_waiting_messages():
+                backoff_step = 0
+            # checked even without new messages, which may have been
+            # processed by another coroutine
+            node = first_node(**kwargs)
+            if node is not None:
+                return node
+            if timeout is not None and monotonic() >= t0 + timeout:
+                return None
+            backoff_step = wait_for_messages_backoff(backoff_step)
             yield
 
     @types.coroutine
     def wait_for_status(self, expected_status, **kwargs):
         """Wait until the first node has the specified status.
         """
+        process_waiting_messages = self.process_waiting_messages
+        first_node = self.first_node
+        wait_for_messages_backoff = self.wait_for_messages_backoff
+        backoff_step = 0
         while True:
-            if self.process_waiting_messages():
-                node = self.first_node(**kwargs)
-                if node is not None and node.status == expected_status:
-                    return
-            else:
-                sleep(self.DEFAULT_SLEEP)
+            if process_waiting_messages():
+                backoff_step = 0
+            node = first_node(**kwargs)
+            if node is not None and node.status == expected_status:
+                return
+            backoff_step = wait_for_messages_backoff(backoff_step)
             yield
 
     @types.coroutine
     def wait_for_status_set(self, expected_status_set, **kwargs):
         """Wait until the first node has one of the specified statuses.
         """
+        process_waiting_messages = self.process_waiting_messages
+        first_node = self.first_node
+        wait_for_messages_backoff = self.wait_for_messages_backoff
+        backoff_step = 0
         while True:
-            if self.process_waiting_messages():
-                node = self.first_node(**kwargs)
-                if node is not None and node.status in expected_status_set:
-                    return
-            else:
-                sleep(self.DEFAULT_SLEEP)
+            if process_waiting_messages():
+                backoff_step = 0
+            node = first_node(**kwargs)
+            if node is not None and node.status in expected_status_set:
+                return
+            backoff_step = wait_for_messages_backoff(backoff_step)
             yield
 
     @types.coroutine
@@ -161,21 +205,18 @@ class ClientAsync(tdmclient.Client):
         Parameter: send_fun(request_id_notify)
         """
 
-        result = None
-        done = False
+        # notified result (list with a single element once received)
+        result = []
 
-        def notify(r):
-            nonlocal result
-            nonlocal done
-            result = r
-            done = True
-
-        send_fun(notify)
-        while not done:
+        send_fun(result.append)
+        backoff_step = 0
+        while not result:
+            if self.process_waiting_messages():
+                backoff_step = 0
+            else:
+                backoff_step = self.wait_for_messages_backoff(backoff_step)
             yield
-            sleep(self.DEFAULT_SLEEP)
-            self.process_waiting_messages()
-        return result
+        return result[0]
 
     @staticmethod
     def step_coroutine(co):
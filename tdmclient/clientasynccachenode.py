@@ -131,9 +131,8 @@ class ClientAsyncCacheNode(ClientAsyncNode):
 
         while not set(self.var).issuperset(var_set):
             if not self.thymio.process_waiting_messages():
-                yield from self.thymio.sleep(self.thymio.DEFAULT_SLEEP)
-            else:
-                yield
+                self.thymio.wait_for_messages(self.thymio.DEFAULT_SLEEP)
+            yield
 
     def mark_change(self, var_name):
         self.var_to_send[var_name] = self.var[var_name]
@@ -20,12 +20,13 @@ class InputThread(threading.Thread):
     """Thread which reads packets asynchronously.
     """
 
-    def __init__(self, io, io_lock, packet_queue=None):
+    def __init__(self, io, io_lock, packet_queue=None, packet_event=None):
         threading.Thread.__init__(self)
         self.running = True
         self.io = io
         self.io_lock = io_lock
         self.packet_queue = packet_queue
+        self.packet_event = packet_event
         self.comm_error = None
         self.on_terminated = []
 
@@ -73,6 +74,8 @@ class InputThread(threading.Thread):
                 packet = self.read_packet()
                 if self.packet_queue is not None:
                     self.packet_queue.put(packet)
+                if self.packet_event is not None:
+                    self.packet_event.set()
             except TimeoutError:
                 pass
 
@@ -106,12 +109,15 @@ class TDMConnection:
         self.timeout = 3
         self.comm_error = None
         self.input_queue = queue.Queue()
+        # set when a packet is put in input_queue, cleared when it's empty
+        self.input_event = threading.Event()
 
         self.io_lock = threading.Lock()
         self.input_lock = threading.Lock()
         self.input_thread = InputThread(self.io,
                                         self.io_lock,
-                                        packet_queue=self.input_queue)
+                                        packet_queue=self.input_queue,
+                                        packet_event=self.input_event)
         self.input_thread.start()
 
         self.output_lock = threading.Lock()
@@ -174,4 +180,15 @@ class TDMConnection:
         try:
             return self.input_queue.get_nowait()
         except queue.Empty:
-            return None
+            self.input_event.clear()
+            # check again in case a packet was received before clear()
+            try:
+                return self.input_queue.get_nowait()
+            except queue.Empty:
+                return None
+
+    def wait_packet(self, timeout=None) -> bool:
+        """Wait until a packet has been received or timeout has elapsed.
+        Return True if a packet is available.
+        """
+        return self.input_event.wait(timeout)
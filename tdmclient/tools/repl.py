@@ -6,7 +6,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import sys
-import getopt
+import argparse
 
 from tdmclient import ClientAsync, TDMConsole
 
@@ -36,58 +36,47 @@ Options:
 """)
 
 
-def main(argv=None, tdm_transport=None):
-    zeroconf = False
-    tdm_addr = None
-    tdm_port = None
-    tdm_ws = False
-    password = None
-    robot_id = None
-    robot_name = None
+def _tdm_port(val):
+    if val == "default":
+        return ClientAsync.DEFAULT_TDM_PORT
+    try:
+        return int(val)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid port {val!r}") from None
+
+
+# option parser, built once; help is displayed by help()
+_PARSER = argparse.ArgumentParser(prog="python3 -m tdmclient repl",
+                                  usage="%(prog)s [options]",
+                                  add_help=False)
+_PARSER.add_argument("--help", action="store_true")
+_PARSER.add_argument("--password")
+_PARSER.add_argument("--robotid", dest="robot_id")
+_PARSER.add_argument("--robotname", dest="robot_name")
+_PARSER.add_argument("--tdmaddr", dest="tdm_addr")
+_PARSER.add_argument("--tdmport", dest="tdm_port", type=_tdm_port)
+_PARSER.add_argument("--tdmws", dest="tdm_ws", action="store_true")
+_PARSER.add_argument("--zeroconf", action="store_true")
 
-    if argv is not None:
-        try:
-            arguments, values = getopt.getopt(argv[1:],
-                                              "",
-                                              [
-                                                  "help",
-                                                  "password=",
-                                                  "robotid=",
-                                                  "robotname=",
-                                                  "tdmaddr=",
-                                                  "tdmport=",
-                                                  "tdmws",
-                                                  "zeroconf",
-                                              ])
-        except getopt.error as err:
-            print(str(err))
-            return 1
-        for arg, val in arguments:
-            if arg == "--help":
-                help()
-                return 0
-            elif arg == "--password":
-                password = val
-            elif arg == "--robotid":
-                robot_id = val
-            elif arg == "--robotname":
-                robot_name = val
-            elif arg == "--tdmaddr":
-                tdm_addr = val
-            elif arg == "--tdmport":
-                tdm_port = ClientAsync.DEFAULT_TDM_PORT if val == "default" else int(val)
-            elif arg == "--tdmws":
-                tdm_ws = True
-            elif arg == "--zeroconf":
-                zeroconf = True
 
-    with ClientAsync(zeroconf=zeroconf,
-                     tdm_addr=tdm_addr, tdm_port=tdm_port, tdm_ws=tdm_ws,
+def main(argv=None, tdm_transport=None):
+    try:
+        options = _PARSER.parse_args(argv[1:] if argv is not None else [])
+    except SystemExit:
+        # error message already displayed by argparse
+        return 1
+    if options.help:
+        help()
+        return 0
+
+    with ClientAsync(zeroconf=options.zeroconf,
+                     tdm_addr=options.tdm_addr, tdm_port=options.tdm_port,
+                     tdm_ws=options.tdm_ws,
                      tdm_transport=tdm_transport,
-                     password=password) as client:
+                     password=options.password) as client:
 
         async def co_init():
-            with await client.lock(node_id=robot_id, node_name=robot_name) as node:
+            with await client.lock(node_id=options.robot_id, node_name=options.robot_name) as node:
                 interactive_console = TDMConsole(user_functions={
                     "get_client": lambda: client,
                     "get_node": lambda: node,
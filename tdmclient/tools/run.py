@@ -6,9 +6,10 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import sys
-import os
-import getopt
+import argparse
+import functools
 import re
+from pathlib import Path
 
 from tdmclient import ClientAsync
 from tdmclient.atranspiler import ATranspiler
@@ -42,189 +43,177 @@ Options:
 """, **kwargs)
 
 
+# N or N[S] for option --event
+event_re = re.compile(r"^([^[]+)(?:\[(\d+)\])?$", re.ASCII)
+
+
+# preamble of Python programs unless --nothymio
+PREAMBLE_THYMIO = """from thymio import *
+"""
+
+
+@functools.lru_cache(maxsize=2)
+def _get_transpiler(import_thymio):
+    """Get a transpiler with modules thymio and clock, reused by successive
+    calls to main() (set_source resets everything specific to a program).
+    """
+    transpiler = ATranspiler()
+    modules = {
+        "thymio": ModuleThymio(transpiler),
+        "clock": ModuleClock(transpiler),
+    }
+    transpiler.modules = {**transpiler.modules, **modules}
+    if import_thymio:
+        transpiler.set_preamble(PREAMBLE_THYMIO)
+    return transpiler
+
+
+def _event(val):
+    r = event_re.match(val)
+    if r is None:
+        raise argparse.ArgumentTypeError(f"invalid event {val!r}")
+    return (
+        r.group(1),
+        0 if r.group(2) is None else int(r.group(2)),
+    )
+
+
+def _tdm_port(val):
+    if val == "default":
+        return ClientAsync.DEFAULT_TDM_PORT
+    try:
+        return int(val)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid port {val!r}") from None
+
+
+# option parser, built once; help is displayed by help()
+_PARSER = argparse.ArgumentParser(prog="python3 -m tdmclient run",
+                                  usage="%(prog)s [options] [filename]",
+                                  add_help=False)
+_PARSER.add_argument("--debug", type=int, default=0)
+_PARSER.add_argument("--event", dest="events", action="append", type=_event)
+_PARSER.add_argument("--help", action="store_true")
+_PARSER.add_argument("--language")
+# sleep: True to sleep forever, False to exit immediately, None for auto
+_PARSER.add_argument("--nosleep", dest="sleep", action="store_const", const=False)
+_PARSER.add_argument("--nothymio", dest="import_thymio", action="store_false")
+_PARSER.add_argument("--password")
+_PARSER.add_argument("--robotid", dest="robot_id")
+_PARSER.add_argument("--robotname", dest="robot_name")
+# scratchpad: 1=--scratchpad, 2=--sponly
+_PARSER.add_argument("--scratchpad", action="store_const", const=1, default=0)
+_PARSER.add_argument("--sleep", dest="sleep", action="store_const", const=True)
+_PARSER.add_argument("--sponly", dest="scratchpad", action="store_const", const=2)
+_PARSER.add_argument("--stop", action="store_true")
+_PARSER.add_argument("--tdmaddr", dest="tdm_addr")
+_PARSER.add_argument("--tdmport", dest="tdm_port", type=_tdm_port)
+_PARSER.add_argument("--tdmws", dest="tdm_ws", action="store_true")
+_PARSER.add_argument("--zeroconf", action="store_true")
+_PARSER.add_argument("values", nargs="*")
+
+
 def main(argv=None, tdm_transport=None):
-    debug = 0
-    language = None  # auto
-    stop = False
-    scratchpad = 0  # 1=--scratchpad, 2=--sponly
-    zeroconf = False
-    tdm_addr = None
-    tdm_port = None
-    tdm_ws = False
-    password = None
-    robot_id = None
-    robot_name = None
-    events = []
-    event_re = re.compile(r"^([^[]*)(\[([0-9]]*)\])?")
-    sleep = None  # True to sleep forever, False to exit immediately
-    import_thymio = True
+    try:
+        options = _PARSER.parse_args(argv[1:] if argv is not None else [])
+    except SystemExit:
+        # error message already displayed by argparse
+        return 1
+    if options.help:
+        help()
+        return 0
+
+    language = options.language  # None for auto
+    events = options.events or []
+    sleep = options.sleep
+    values = options.values
 
     print_statements = []
     exit_received = None  # or exit status once received, or 1 if vm error
 
+    write = sys.stdout.write
+
     def on_event_received(node, event_name, event_data):
         if event_name == "_exit":
-            global exit_received
+            nonlocal exit_received
             exit_received = event_data[0]
         elif event_name == "_print":
-            print_id = event_data[0]
-            print_format, print_num_args = print_statements[print_id]
-            print_args = tuple(event_data[1 : 1 + print_num_args])
-            print_str = print_format % print_args
-            print(print_str)
+            print_format, print_num_args = print_statements[event_data[0]]
+            write(print_format % tuple(event_data[1 : 1 + print_num_args]) + "\n")
         else:
-            print(event_name + "".join(["," + str(d) for d in event_data]))
+            print(event_name + ("," + ",".join(map(str, event_data)) if event_data else ""))
 
     def on_vm_state_changed(node, state, line, error, error_msg):
         if error != ClientAsync.ERROR_NO_ERROR:
-            global exit_received
+            nonlocal exit_received
             exit_received = 1
         if error_msg:
             print(f"{error_msg} (line {line}{' in Aseba' if language != 'aseba' else ''})")
 
-    if argv is not None:
-        try:
-            arguments, values = getopt.getopt(argv[1:],
-                                              "",
-                                              [
-                                                  "debug=",
-                                                  "event=",
-                                                  "help",
-                                                  "language=",
-                                                  "nosleep",
-                                                  "nothymio",
-                                                  "password=",
-                                                  "robotid=",
-                                                  "robotname=",
-                                                  "scratchpad",
-                                                  "sleep",
-                                                  "sponly",
-                                                  "stop",
-                                                  "tdmaddr=",
-                                                  "tdmport=",
-                                                  "tdmws",
-                                                  "zeroconf",
-                                              ])
-        except getopt.error as err:
-            print(str(err), file=sys.stderr)
-            return 1
-        for arg, val in arguments:
-            if arg == "--help":
-                help()
-                return 0
-            elif arg == "--debug":
-                debug = int(val)
-            elif arg == "--event":
-                r = event_re.match(val)
-                if r is None:
-                    help(file=sys.stderr)
-                    return 1
-                events.append((
-                    r.group(1),
-                    0 if r.group(3) is None else int(r.group(3)),
-                ))
-            elif arg == "--language":
-                language = val
-            elif arg == "--nosleep":
-                sleep = False
-            elif arg == "--nothymio":
-                import_thymio = False
-            elif arg == "--password":
-                password = val
-            elif arg == "--robotid":
-                robot_id = val
-            elif arg == "--robotname":
-                robot_name = val
-            elif arg == "--scratchpad":
-                scratchpad = 1
-            elif arg == "--sleep":
-                sleep = True
-            elif arg == "--sponly":
-                scratchpad = 2
-            elif arg == "--stop":
-                stop = True
-            elif arg == "--tdmaddr":
-                tdm_addr = val
-            elif arg == "--tdmport":
-                tdm_port = ClientAsync.DEFAULT_TDM_PORT if val == "default" else int(val)
-            elif arg == "--tdmws":
-                tdm_ws = True
-            elif arg == "--zeroconf":
-                zeroconf = True
-
-    if stop:
+    if options.stop:
         if len(values) > 0:
             help(file=sys.stderr)
             return 1
     else:
         if len(values) == 0:
             program = sys.stdin.read()
-            if language is None:
-                # try to transpile code from Python
-                try:
-                    transpiler = ATranspiler()
-                    if import_thymio:
-                        transpiler.set_preamble("""from thymio import *
-""")
-                    transpiler.set_source(program)
-                    transpiler.transpile()
-                    # successful, must be Python
-                    language = "python"
-                except:
-                    # failure, assume Aseba
-                    language = "aseba"
         elif len(values) == 1:
-            with open(values[0]) as f:
-                program = f.read()
+            path = Path(values[0])
+            program = path.read_text()
             if language is None:
                 # guess language from file extension
-                language = "python" if os.path.splitext(values[0])[1] == ".py" else "aseba"
+                language = "python" if path.suffix == ".py" else "aseba"
         else:
             help(file=sys.stderr)
             return 1
 
     status = 0
 
-    if language == "python":
+    if not options.stop and language in (None, "python"):
         # transpile from Python to Aseba
-        transpiler = ATranspiler()
-        modules = {
-            "thymio": ModuleThymio(transpiler),
-            "clock": ModuleClock(transpiler),
-        }
-        transpiler.modules = {**transpiler.modules, **modules}
-        if import_thymio:
-            transpiler.set_preamble("""from thymio import *
-""")
+        transpiler = _get_transpiler(options.import_thymio)
         transpiler.set_source(program)
-        transpiler.transpile()
-        program = transpiler.get_output()
-        print_statements = transpiler.print_format_strings
-        if len(print_statements) > 0:
-            events.append(("_print", 1 + transpiler.print_max_num_args))
-        if transpiler.has_exit_event:
-            events.append(("_exit", 1))
-        for event_name in transpiler.events_in:
-            events.append((event_name, transpiler.events_in[event_name]))
-        for event_name in transpiler.events_out:
-            events.append((event_name, transpiler.events_out[event_name]))
-
-    with ClientAsync(zeroconf=zeroconf,
-                     tdm_addr=tdm_addr, tdm_port=tdm_port, tdm_ws=tdm_ws,
+        if language is None:
+            # try to transpile code from Python
+            try:
+                transpiler.transpile()
+                # successful, must be Python
+                language = "python"
+            except:
+                # failure, assume Aseba
+                language = "aseba"
+        else:
+            transpiler.transpile()
+
+        if language == "python":
+            program = transpiler.get_output()
+            print_statements = transpiler.print_format_strings
+            if len(print_statements) > 0:
+                events.append(("_print", 1 + transpiler.print_max_num_args))
+            if transpiler.has_exit_event:
+                events.append(("_exit", 1))
+            for event_name in transpiler.events_in:
+                events.append((event_name, transpiler.events_in[event_name]))
+            for event_name in transpiler.events_out:
+                events.append((event_name, transpiler.events_out[event_name]))
+
+    with ClientAsync(zeroconf=options.zeroconf,
+                     tdm_addr=options.tdm_addr, tdm_port=options.tdm_port,
+                     tdm_ws=options.tdm_ws,
                      tdm_transport=tdm_transport,
-                     password=password,
-                     debug=debug) as client:
+                     password=options.password,
+                     debug=options.debug) as client:
 
         async def prog():
             nonlocal status, events, sleep
-            with await client.lock(node_id=robot_id, node_name=robot_name) as node:
-                if stop:
+            with await client.lock(node_id=options.robot_id, node_name=options.robot_name) as node:
+                if options.stop:
                     error = await node.stop()
                     if error is not None:
                         print(f"Stop error {error['error_code']}")
                         status = 2
                 else:
-                    if scratchpad < 2:
+                    if options.scratchpad < 2:
                         if len(events) > 0:
                             events = await node.filter_out_vm_events(events)
                             await node.register_events(events)
@@ -244,12 +233,12 @@ def main(argv=None, tdm_transport=None):
                             if error is not None:
                                 print(f"Run error {error['error_code']}")
                                 status = 2
-                    if scratchpad > 0:
+                    if options.scratchpad > 0:
                         error = await node.set_scratchpad(program)
                         if error is not None:
                             print(f"Scratchpad error {error['error_code']}")
                             status = 2
-                    if scratchpad < 2 and sleep:
+                    if options.scratchpad < 2 and sleep:
                         # expect events: wait forever or until _exit is received
                         def wake():
                             return exit_received is not None
@@ -13,6 +13,7 @@ Author: Yves Piguet, EPFL
 from . import TDMConnection
 import websocket
 import socket
+import select
 
 
 class TDMConnectionWS(TDMConnection):
@@ -57,6 +58,9 @@ class TDMConnectionWS(TDMConnection):
     def receive_packet(self):
         """Get next received packet, or None if none.
         """
+        if not self.wait_packet(0):
+            # nothing to read: avoid waiting for SMALL_TIMEOUT
+            return None
         timeout_orig = self.ws.gettimeout()
         self.ws.sock.settimeout(self.SMALL_TIMEOUT)
         try:
@@ -65,3 +69,10 @@ class TDMConnectionWS(TDMConnection):
             return None
         finally:
             self.ws.sock.settimeout(timeout_orig)
+
+    def wait_packet(self, timeout=None) -> bool:
+        """Wait until data has been received or timeout has elapsed.
+        Return True if data is available.
+        """
+        ready, _, _ = select.select([self.ws.sock], [], [], timeout)
+        return len(ready) > 0
@@ -10,75 +10,100 @@ vpl-web's compiler in JavaScript.
 """
 
 import dukpy
+import functools
 import json
 import os
 
+
+@functools.lru_cache(maxsize=None)
+def vpl_compiler_src(path_vpl):
+    """Get the JavaScript source code of vpl-web's compiler, read only once.
+    """
+    src = ""
+    for filename in (
+        "a3a-ns.js",
+        "compiler-ns.js",
+        "compiler-vm.js",
+        "compiler.js",
+        "compiler-macros.js",
+        "compiler-thymio.js",
+    ):
+        with open(path_vpl + filename) as f:
+            src += f.read()
+
+    # patch for dukpy
+    return src.replace("Math.trunc", "Math.floor")
+
+
+# code evaluated after the definition of asebaSourceCodes (array of Aseba
+# source code strings), with the compiler already loaded -> json array
+# with either [bc, variables, local_events] or error message for each
+SRC_POSTAMBLE = """
+JSON.stringify(asebaSourceCodes.map(function (asebaSourceCode) {
+    try {
+        var asebaNode = new A3a.A3aNode(A3a.thymioDescr);
+        var c = new A3a.Compiler(asebaNode, asebaSourceCode);
+        c.functionLib = A3a.A3aNode.stdMacros;
+        c.addUserEvent("_exit", 1);
+        var bytecode = c.compile();
+        return [
+            bytecode,
+            c.asebaNode.variables.concat(c.declaredVariables),
+            asebaNode.localEvents
+        ];
+    } catch (e) {
+        return e.toString();
+    }
+}))
+"""
+
+
 class AsebaCompiler:
 
     def __init__(self, rel_path_vpl="../../../vpl-web/src/"):
 
         path_vpl = os.path.dirname(os.path.realpath(__file__)) + "/" + rel_path_vpl
-        self.src_preamble = ""
-        for filename in (
-            "a3a-ns.js",
-            "compiler-ns.js",
-            "compiler-vm.js",
-            "compiler.js",
-            "compiler-macros.js",
-            "compiler-thymio.js",
-        ):
-            with open(path_vpl + filename) as f:
-                self.src_preamble += f.read()
-
-        # preamble + js + postamble -> either [bc, variables, local_events]
-        # or error message as json
-
-        self.src_preamble += """
-var r = null;
-try {
-    var asebaSourceCode =
-"""
+        self.src_preamble = vpl_compiler_src(path_vpl)
 
-        # patch for dukpy
-        self.src_preamble = self.src_preamble.replace("Math.trunc", "Math.floor")
-
-        self.src_postamble = """
-;
-    var asebaNode = new A3a.A3aNode(A3a.thymioDescr);
-    var c = new A3a.Compiler(asebaNode, asebaSourceCode);
-    c.functionLib = A3a.A3aNode.stdMacros;
-    c.addUserEvent("_exit", 1);
-    var bytecode = c.compile();
-    r = JSON.stringify([
-        bytecode,
-        c.asebaNode.variables.concat(c.declaredVariables),
-        asebaNode.localEvents
-    ])
-} catch (e) {
-    r = JSON.stringify(e.toString());
-}
-r
-"""
+        # persistent interpreter where the compiler is parsed only once
+        self.js = dukpy.JSInterpreter()
+        # (null to avoid returning a value which can't be converted)
+        self.js.evaljs(self.src_preamble + "\n;null;\n")
+
+    @staticmethod
+    def js_compile_code(aseba_src_codes):
+        """Get the JavaScript code which compiles a list of Aseba source
+        codes, once the compiler has been loaded.
+        """
+        return ("var asebaSourceCodes = " + json.dumps(aseba_src_codes) + ";\n"
+                + SRC_POSTAMBLE)
 
     def js_code(self, aseba_src_code):
-        src = self.src_preamble + json.dumps(aseba_src_code) + self.src_postamble
+        src = self.src_preamble + self.js_compile_code([aseba_src_code])
         return src
 
+    def compile_many(self, aseba_src_codes):
+        """Compile a list of Aseba source codes with a single evaluation in
+        the JavaScript interpreter and return a list of tuples
+        (bc, variable_descriptions, event_descriptions).
+        """
+        src = self.js_compile_code(aseba_src_codes)
+        results = json.loads(self.js.evaljs(src))
+        for r in results:
+            if isinstance(r, str):
+                # error message
+                raise Exception(r)
+        return [tuple(r) for r in results]
+
     def compile(self, aseba_src_code):
         """Compile Aseba source code and return a dict with bytecode in "bc"
         and array of variables ({name:string,size:int,offset:int}) in "variables"
         """
-        src = self.js_code(aseba_src_code)
-        r = json.loads(dukpy.evaljs(src))
-        if isinstance(r, str):
-            # error message
-            raise Exception(r)
-        else:
-            (
-                self.bc,
-                self.variable_descriptions,
-                self.event_descriptions,
-            ) = r
+        (
+            self.bc,
+            self.variable_descriptions,
+            self.event_descriptions,
+        ) = self.compile_many([aseba_src_code])[0]
 
     def event_name_to_event_id(self, event_name):
         if event_name == "init":
@@ -0,0 +1,34 @@
+import unittest
+from tdmclient.tools import run
+
+class TestRunOptions(unittest.TestCase):
+
+    def test_events(self):
+        options = run._PARSER.parse_args(["--event=foo", "--event=bar[5]"])
+        self.assertEqual(options.events, [("foo", 0), ("bar", 5)])
+
+    def test_invalid_events(self):
+        self.assertEqual(run.main(["run", "--event=foo["]), 1)
+        self.assertEqual(run.main(["run", "--event=[3]"]), 1)
+
+    def test_sleep(self):
+        self.assertIsNone(run._PARSER.parse_args([]).sleep)
+        self.assertTrue(run._PARSER.parse_args(["--sleep"]).sleep)
+        self.assertFalse(run._PARSER.parse_args(["--nosleep"]).sleep)
+        self.assertTrue(run._PARSER.parse_args(["--nosleep", "--sleep"]).sleep)
+
+    def test_scratchpad(self):
+        self.assertEqual(run._PARSER.parse_args([]).scratchpad, 0)
+        self.assertEqual(run._PARSER.parse_args(["--scratchpad"]).scratchpad, 1)
+        self.assertEqual(run._PARSER.parse_args(["--sponly"]).scratchpad, 2)
+
+    def test_tdm_port(self):
+        self.assertEqual(run._PARSER.parse_args(["--tdmport=default"]).tdm_port,
+                         run.ClientAsync.DEFAULT_TDM_PORT)
+        self.assertEqual(run._PARSER.parse_args(["--tdmport=1234"]).tdm_port, 1234)
+        self.assertEqual(run.main(["run", "--tdmport=abc"]), 1)
+
+    def test_values(self):
+        options = run._PARSER.parse_args(["--nothymio", "prog.py"])
+        self.assertFalse(options.import_thymio)
+        self.assertEqual(options.values, ["prog.py"])
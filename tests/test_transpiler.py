@@ -4,6 +4,9 @@ from aseba import AsebaCompiler, AsebaVM
 
 class TestTranspiler(unittest.TestCase):
 
+    # compiler shared by all tests, created when first needed
+    compiler = None
+
     def test_empty(self):
         src_py = ""
         src_a = ATranspiler.simple_transpile(src_py).strip()
@@ -30,16 +33,34 @@ class TestTranspiler(unittest.TestCase):
         src_a = ATranspiler.simple_transpile(src_py).replace(" ", "")
         self.assertTrue("a=[1,2,3]" in src_a)
 
+    def test_reused_transpiler(self):
+        from tdmclient.module_clock import ModuleClock
+        transpiler = ATranspiler()
+        transpiler.modules = {"clock": ModuleClock(transpiler)}
+        transpiler.set_source("import clock\na = clock.seconds()")
+        transpiler.transpile()
+        self.assertTrue("_ticks50Hz" in transpiler.get_output())
+        transpiler.set_source("a = 123")
+        transpiler.transpile()
+        self.assertFalse("_ticks50Hz" in transpiler.get_output())
+
     # tests below: based on aseba_compiler.py and aseba_vm.py,
     # which require dukpy and a clone of vpl-web in a sibbling directory
 
+    def get_compiler(self):
+        """Get the AsebaCompiler shared by all tests, created when first needed
+        """
+        if TestTranspiler.compiler is None:
+            TestTranspiler.compiler = AsebaCompiler()
+        return TestTranspiler.compiler
+
     def assert_transpiled_code_result(self, src_py, assertTrueFun, emit=None):
         """Transpile Python code, compile it, execute it on a vm, send the
         event whose name is specified by argument emit (unless None) and
         execute assertTrueFun(var_getter)
         """
         src_a = ATranspiler.simple_transpile(src_py)
-        c = AsebaCompiler()
+        c = self.get_compiler()
         c.compile(src_a)
         v = AsebaVM()
         v.set_bytecode(c.bc)
@@ -65,6 +86,20 @@ src_aseba:
 """)
         self.assertTrue(b)
 
+    # batch compilation
+
+    def test_compile_many(self):
+        c = self.get_compiler()
+        names = ["a", "b", "c"]
+        results = c.compile_many([f"var {name} = 1\n" for name in names])
+        self.assertEqual(len(results), len(names))
+        for name, (bc, variable_descriptions, event_descriptions) in zip(names, results):
+            declared = [v["name"] for v in variable_descriptions]
+            self.assertTrue(name in declared)
+            self.assertFalse(set(names).difference({name}).intersection(declared))
+        with self.assertRaises(Exception):
+            c.compile_many(["var a = 1\n", "var = \n"])
+
     # simple assignments
 
     def test_assign_scalar_result(self):